@@ -117,7 +117,7 @@ class AniListClient(BaseAPIClient):
 
         # Get tags as keywords (filter by rank > 60 for relevance)
         tags = item.get('tags', []) or []
-        keywords = {t['name'] for t in tags if t.get('rank', 0) > 60}
+        keywords = frozenset(t['name'] for t in tags if t.get('rank', 0) > 60)
 
         # Get studios
         studios_data = item.get('studios', {}).get('nodes', []) or []
@@ -129,7 +129,7 @@ class AniListClient(BaseAPIClient):
             title=title.get('english') or title.get('romaji') or 'Unknown',
             original_title=title.get('native'),
             overview=self._clean_description(item.get('description')),
-            genres=set(item.get('genres', []) or []),
+            genres=frozenset(item.get('genres', []) or []),
             keywords=keywords,
             release_year=item.get('seasonYear'),
             poster_url=item.get('coverImage', {}).get('large') if item.get('coverImage') else None,
@@ -51,8 +51,12 @@ class TMDBClient(BaseAPIClient):
 
         return results
 
-    def _parse_search_result(self, item: dict, media_type: str) -> Media:
-        """Parse TMDB search result into Media object"""
+    def _parse_search_result(self, item: dict, media_type: str, **detail_fields) -> Media:
+        """
+        Parse TMDB search result into Media object.
+        Extra keyword arguments (genres, keywords, cast, director) fill in
+        detail fields so the Media is complete when constructed.
+        """
         source = MediaSource.TMDB_MOVIE if media_type == 'movie' else MediaSource.TMDB_TV
 
         title_key = 'title' if media_type == 'movie' else 'name'
@@ -67,11 +71,12 @@ class TMDBClient(BaseAPIClient):
             title=item.get(title_key, 'Unknown'),
             original_title=item.get(f'original_{title_key}'),
             overview=item.get('overview'),
-            genres=set(),
+            genres=detail_fields.pop('genres', frozenset()),
             release_year=self._extract_year(item.get(date_key)),
             poster_url=poster_url,
             rating=item.get('vote_average'),
-            popularity=item.get('popularity')
+            popularity=item.get('popularity'),
+            **detail_fields
         )
 
     def get_details(self, media_id: str) -> Optional[Media]:
@@ -89,28 +94,31 @@ class TMDBClient(BaseAPIClient):
                 {'append_to_response': 'credits,keywords'}
             )
 
-            media = self._parse_search_result(details, media_type)
+            # Genres
+            genres = frozenset(g['name'] for g in details.get('genres', []))
 
-            # Add genres
-            media.genres = {g['name'] for g in details.get('genres', [])}
-
-            # Add keywords (from appended response)
+            # Keywords (from appended response)
             keywords_data = details.get('keywords', {})
             keywords_list = keywords_data.get('keywords', keywords_data.get('results', []))
-            media.keywords = {k['name'] for k in keywords_list}
+            keywords = frozenset(k['name'] for k in keywords_list)
 
-            # Add cast (top 5) from appended credits
+            # Cast (top 5) from appended credits
             credits = details.get('credits', {})
-            cast = credits.get('cast', [])[:5]
-            media.cast = [c['name'] for c in cast]
+            cast = [c['name'] for c in credits.get('cast', [])[:5]]
 
-            # Add director (for movies)
+            # Director (for movies)
+            director = None
             if media_type == 'movie':
                 directors = [c for c in credits.get('crew', []) if c.get('job') == 'Director']
                 if directors:
-                    media.director = directors[0]['name']
+                    director = directors[0]['name']
 
-            return media
+            # Build the complete Media at once (its cached properties derive
+            # from these fields)
+            return self._parse_search_result(
+                details, media_type,
+                genres=genres, keywords=keywords, cast=cast, director=director
+            )
 
         except Exception as e:
             print(f"TMDB get_details error: {e}")
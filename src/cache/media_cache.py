@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
@@ -53,13 +53,13 @@ class MediaCache:
         """Cache search results"""
         self.set(f"search:{source}:{query.lower()}", results)
 
-    def get_similar(self, media_id: str) -> Optional[List[Media]]:
-        """Get cached similar items"""
-        return self.get(f"similar:{media_id}")
+    def get_ranked(self, media_id: str) -> Optional[List[Tuple[Media, float]]]:
+        """Get cached ranked recommendations"""
+        return self.get(f"ranked:{media_id}")
 
-    def set_similar(self, media_id: str, results: List[Media]):
-        """Cache similar items"""
-        self.set(f"similar:{media_id}", results)
+    def set_ranked(self, media_id: str, ranked: List[Tuple[Media, float]]):
+        """Cache ranked recommendations"""
+        self.set(f"ranked:{media_id}", ranked)
 
     def clear(self):
         """Clear all cache"""
@@ -77,9 +77,16 @@ class MediaCache:
     def stats(self) -> Dict[str, int]:
         """Return cache statistics"""
         self.cleanup_expired()
+
+        # Count every key prefix in a single pass over the cache
+        counts: Dict[str, int] = {}
+        for key in self._cache:
+            prefix = key.split(':', 1)[0]
+            counts[prefix] = counts.get(prefix, 0) + 1
+
         return {
             'total_entries': len(self._cache),
-            'media_entries': sum(1 for k in self._cache if k.startswith('media:')),
-            'search_entries': sum(1 for k in self._cache if k.startswith('search:')),
-            'similar_entries': sum(1 for k in self._cache if k.startswith('similar:'))
+            'media_entries': counts.get('media', 0),
+            'search_entries': counts.get('search', 0),
+            'ranked_entries': counts.get('ranked', 0)
         }
@@ -1,7 +1,6 @@
 from typing import List, Optional, Tuple, Dict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import sys
-import re
 import json
 from pathlib import Path
 
@@ -89,14 +88,11 @@ class MediaRecommendationSystem:
         results.sort(key=lambda x: x.popularity or 0, reverse=True)
 
         # Deduplicate: prefer AniList for anime over TMDB TV
-        def normalize(t):
-            return re.sub(r'[^a-z0-9]', '', (t or '').lower())
-
         seen_titles = set()
         deduplicated = []
 
         for r in results:
-            norm = normalize(r.title)
+            norm = r.normalized_title
             # If TMDB TV and title already seen (from AniList), skip
             if r.source == MediaSource.TMDB_TV and norm in seen_titles:
                 continue
@@ -140,11 +136,16 @@ class MediaRecommendationSystem:
         if not source_media:
             return None, None, 0
 
-        # Step 2: Gather candidates from multiple sources
-        candidates = self._gather_candidates(source_media)
+        # Ranking is reused across pages of the same source media
+        ranked = self.cache.get_ranked(source_media.id)
+        if not ranked:
+            # Step 2: Gather candidates from multiple sources
+            candidates = self._gather_candidates(source_media)
+
+            # Step 3: Calculate similarity and rank
+            ranked = self.similarity.rank_candidates(source_media, candidates)
+            self.cache.set_ranked(source_media.id, ranked)
 
-        # Step 3: Calculate similarity and rank
-        ranked = self.similarity.rank_candidates(source_media, candidates)
         total_available = len(ranked)
 
         # Step 4: Format results with pagination
@@ -191,12 +192,8 @@ class MediaRecommendationSystem:
         Gather candidate recommendations from all relevant sources.
         Uses API's own recommendations + genre-based search.
         Optimized with parallel API calls.
+        Results are cached by get_recommendations as the ranked list.
         """
-        # Check cache first
-        cached_similar = self.cache.get_similar(source.id)
-        if cached_similar:
-            return cached_similar
-
         candidates = []
         tasks = []
 
@@ -243,24 +240,18 @@ class MediaRecommendationSystem:
         unique_candidates = []
         needs_details = []
 
-        def normalize_title(title: str) -> str:
-            """Normalize title for comparison (lowercase, remove special chars)"""
-            if not title:
-                return ""
-            return re.sub(r'[^a-z0-9]', '', title.lower())
-
         # Add source title to seen titles
-        seen_titles.add(normalize_title(source.title))
+        seen_titles.add(source.normalized_title)
         if source.original_title:
-            seen_titles.add(normalize_title(source.original_title))
+            seen_titles.add(source.normalized_original_title)
 
         for c in candidates:
             if c.id in seen_ids:
                 continue
 
             # Check for title duplicates (anime appearing in both TMDB and AniList)
-            norm_title = normalize_title(c.title)
-            norm_orig = normalize_title(c.original_title) if c.original_title else ""
+            norm_title = c.normalized_title
+            norm_orig = c.normalized_original_title
 
             # If this is a TMDB TV show and the title matches an anime, skip it
             if c.source == MediaSource.TMDB_TV:
@@ -298,9 +289,6 @@ class MediaRecommendationSystem:
                     except Exception:
                         pass
 
-        # Cache the candidates
-        self.cache.set_similar(source.id, unique_candidates)
-
         return unique_candidates
 
     def get_system_info(self) -> Dict:
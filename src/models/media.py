@@ -1,6 +1,36 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
 from enum import Enum
+import re
+import threading
+
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]')
+
+# Genre vocabularies are small and fixed (TMDB and AniList expose about twenty
+# each), so a process-wide bit index stays bounded.
+_GENRE_BITS: Dict[str, int] = {}
+_GENRE_BITS_LOCK = threading.Lock()
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Normalize title for comparison (lowercase, remove special chars)"""
+    if not title:
+        return ""
+    return _NON_ALNUM.sub('', title.lower())
+
+
+def encode_genres(genres: Iterable[str]) -> int:
+    """Encode genres as a bitset over the shared genre vocabulary"""
+    bits = 0
+    for genre in genres:
+        bit = _GENRE_BITS.get(genre)
+        if bit is None:
+            with _GENRE_BITS_LOCK:
+                bit = _GENRE_BITS.setdefault(genre, len(_GENRE_BITS))
+        bits |= 1 << bit
+    return bits
 
 
 class MediaSource(Enum):
@@ -11,14 +41,18 @@ class MediaSource(Enum):
 
 @dataclass
 class Media:
-    """Generic media item (movie, TV series, or anime)"""
+    """
+    Generic media item (movie, TV series, or anime).
+    Build items complete: the cached properties below are derived from the
+    fields on first access and are not refreshed if a field is rebound later.
+    """
     id: str
     source: MediaSource
     title: str
     original_title: Optional[str] = None
     overview: Optional[str] = None
-    genres: Set[str] = field(default_factory=set)
-    keywords: Set[str] = field(default_factory=set)
+    genres: FrozenSet[str] = field(default_factory=frozenset)
+    keywords: FrozenSet[str] = field(default_factory=frozenset)
     release_year: Optional[int] = None
     poster_url: Optional[str] = None
     rating: Optional[float] = None
@@ -33,6 +67,36 @@ class Media:
     season: Optional[str] = None
     episodes: Optional[int] = None
 
+    @cached_property
+    def normalized_title(self) -> str:
+        """Normalized title, computed once per item for deduplication"""
+        return normalize_title(self.title)
+
+    @cached_property
+    def normalized_original_title(self) -> str:
+        """Normalized original title, computed once per item for deduplication"""
+        return normalize_title(self.original_title)
+
+    @cached_property
+    def genre_bits(self) -> int:
+        """Genres as a bitset, computed once per item for similarity scoring"""
+        return encode_genres(self.genres)
+
+    @cached_property
+    def cast_lower(self) -> FrozenSet[str]:
+        """Lowercased cast names, computed once per item"""
+        return frozenset(c.lower() for c in self.cast)
+
+    @cached_property
+    def studios_lower(self) -> FrozenSet[str]:
+        """Lowercased studio names, computed once per item"""
+        return frozenset(s.lower() for s in self.studios)
+
+    @cached_property
+    def director_lower(self) -> Optional[str]:
+        """Lowercased director name, computed once per item"""
+        return self.director.lower() if self.director else None
+
     def get_feature_vector(self) -> Set[str]:
         """Returns all features for similarity calculation"""
         features = set()
@@ -1,12 +1,25 @@
-from typing import List, Set, Tuple
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from typing import AbstractSet, FrozenSet, List, NamedTuple, Optional, Tuple
+from operator import itemgetter
+import heapq
 
 from src.models.media import Media
 
 
+# Weight of the year proximity bonus (shared by WEIGHTS and YEAR_BONUS)
+_YEAR_WEIGHT = 0.05
+
+
+class SourceContext(NamedTuple):
+    """Source-side features, precomputed once per ranking pass"""
+    genre_count: int
+    genre_bits: int
+    keywords: FrozenSet[str]
+    cast_lower: FrozenSet[str]
+    director_lower: Optional[str]
+    studios_lower: FrozenSet[str]
+    release_year: Optional[int]
+
+
 class ContentSimilarity:
     """Content-based similarity calculator using weighted Jaccard similarity"""
 
@@ -17,99 +30,140 @@ class ContentSimilarity:
         'cast': 0.15,
         'director': 0.10,
         'studio': 0.10,
-        'year': 0.05
+        'year': _YEAR_WEIGHT
     }
 
+    # Weighted year proximity bonus, indexed by year difference (0-5 years)
+    YEAR_BONUS = tuple((5 - year_diff) / 5 * _YEAR_WEIGHT for year_diff in range(6))
+
     @staticmethod
-    def jaccard_similarity(set1: Set[str], set2: Set[str]) -> float:
+    def jaccard_similarity(set1: AbstractSet[str], set2: AbstractSet[str]) -> float:
         """Calculate Jaccard similarity between two sets"""
         if not set1 or not set2:
             return 0.0
 
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
+        # |A u B| = |A| + |B| - |A n B|, so no union set is built
+        intersection = len(set1 & set2)
+        union = len(set1) + len(set2) - intersection
 
         return intersection / union if union > 0 else 0.0
 
     @staticmethod
-    def weighted_similarity(source: Media, candidate: Media) -> float:
+    def jaccard_bits(bits1: int, bits2: int, size1: int, size2: int) -> float:
+        """Calculate Jaccard similarity between two bitsets of known sizes"""
+        intersection = bin(bits1 & bits2).count('1')
+        union = size1 + size2 - intersection
+
+        return intersection / union if union > 0 else 0.0
+
+    @staticmethod
+    def _source_context(source: Media) -> SourceContext:
         """
-        Calculate weighted content similarity between two media items.
-        Returns a score between 0.0 and 1.0
+        Precompute the source-side features used by _score.
+        Built once per ranking pass instead of once per candidate.
         """
+        return SourceContext(
+            genre_count=len(source.genres),
+            genre_bits=source.genre_bits,
+            keywords=source.keywords,
+            cast_lower=source.cast_lower,
+            director_lower=source.director_lower,
+            studios_lower=source.studios_lower,
+            release_year=source.release_year
+        )
+
+    @staticmethod
+    def _score(ctx: SourceContext, candidate: Media) -> float:
+        """Calculate weighted similarity between a source context and a candidate"""
         score = 0.0
         weights = ContentSimilarity.WEIGHTS
 
         # Genre similarity (most important)
-        if source.genres and candidate.genres:
-            genre_sim = ContentSimilarity.jaccard_similarity(
-                source.genres, candidate.genres
+        if ctx.genre_count and candidate.genres:
+            genre_sim = ContentSimilarity.jaccard_bits(
+                ctx.genre_bits, candidate.genre_bits,
+                ctx.genre_count, len(candidate.genres)
             )
             score += genre_sim * weights['genre']
 
         # Keyword similarity
-        if source.keywords and candidate.keywords:
+        if ctx.keywords and candidate.keywords:
             keyword_sim = ContentSimilarity.jaccard_similarity(
-                source.keywords, candidate.keywords
+                ctx.keywords, candidate.keywords
             )
             score += keyword_sim * weights['keyword']
 
         # Cast similarity (top 5 actors)
-        if source.cast and candidate.cast:
-            cast_set1 = {c.lower() for c in source.cast}
-            cast_set2 = {c.lower() for c in candidate.cast}
-            cast_sim = ContentSimilarity.jaccard_similarity(cast_set1, cast_set2)
+        if ctx.cast_lower and candidate.cast:
+            cast_sim = ContentSimilarity.jaccard_similarity(
+                ctx.cast_lower, candidate.cast_lower
+            )
             score += cast_sim * weights['cast']
 
         # Director match (binary)
-        if source.director and candidate.director:
-            if source.director.lower() == candidate.director.lower():
+        if ctx.director_lower and candidate.director:
+            if ctx.director_lower == candidate.director_lower:
                 score += weights['director']
 
         # Studio similarity (for anime)
-        if source.studios and candidate.studios:
-            studio_set1 = {s.lower() for s in source.studios}
-            studio_set2 = {s.lower() for s in candidate.studios}
-            studio_sim = ContentSimilarity.jaccard_similarity(studio_set1, studio_set2)
+        if ctx.studios_lower and candidate.studios:
+            studio_sim = ContentSimilarity.jaccard_similarity(
+                ctx.studios_lower, candidate.studios_lower
+            )
             score += studio_sim * weights['studio']
 
         # Year proximity bonus (within 5 years = bonus)
-        if source.release_year and candidate.release_year:
-            year_diff = abs(source.release_year - candidate.release_year)
+        if ctx.release_year and candidate.release_year:
+            year_diff = abs(ctx.release_year - candidate.release_year)
             if year_diff <= 5:
-                year_bonus = (5 - year_diff) / 5
-                score += year_bonus * weights['year']
+                score += ContentSimilarity.YEAR_BONUS[year_diff]
 
-        return min(score, 1.0)
+        return score if score < 1.0 else 1.0
+
+    @staticmethod
+    def weighted_similarity(source: Media, candidate: Media) -> float:
+        """
+        Calculate weighted content similarity between two media items.
+        Returns a score between 0.0 and 1.0
+        """
+        return ContentSimilarity._score(
+            ContentSimilarity._source_context(source), candidate
+        )
 
     @staticmethod
     def rank_candidates(
         source: Media,
         candidates: List[Media],
-        min_similarity: float = 0.1
+        min_similarity: float = 0.1,
+        top_k: Optional[int] = None
     ) -> List[Tuple[Media, float]]:
         """
         Rank candidates by similarity to source.
         Returns list of (media, similarity_score) tuples, sorted descending.
+        If top_k is given, only the best top_k results are returned.
         """
-        scored = []
-        seen_ids = set()
-
+        # Skip duplicates (keeping the first occurrence) and same item
+        unique = {}
         for candidate in candidates:
-            # Skip duplicates and same item
-            if candidate.id == source.id or candidate.id in seen_ids:
-                continue
-            seen_ids.add(candidate.id)
+            unique.setdefault(candidate.id, candidate)
+        unique.pop(source.id, None)
 
-            similarity = ContentSimilarity.weighted_similarity(source, candidate)
+        scored = []
+        ctx = ContentSimilarity._source_context(source)
+        score = ContentSimilarity._score  # bound once, outside the loop
+
+        for candidate in unique.values():
+            similarity = score(ctx, candidate)
 
             if similarity >= min_similarity:
-                scored.append((candidate, similarity))
+                scored.append((similarity, candidate.rating or 0, candidate))
 
         # Sort by similarity (descending), then by rating (descending)
-        scored.sort(
-            key=lambda x: (x[1], x[0].rating or 0),
-            reverse=True
-        )
+        sort_key = itemgetter(0, 1)
+
+        if top_k is not None:
+            scored = heapq.nlargest(top_k, scored, key=sort_key)
+        else:
+            scored.sort(key=sort_key, reverse=True)
 
-        return scored
+        return [(candidate, similarity) for similarity, _, candidate in scored]